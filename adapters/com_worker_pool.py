@@ -0,0 +1,59 @@
+from __future__ import annotations
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+
+class ComWorkerPool:
+    """Small pool of daemon worker threads that each run an init hook first.
+
+    Used to give every worker its own COM apartment. Workers are daemons so a
+    call stuck inside a misbehaving driver never blocks interpreter exit.
+    """
+
+    def __init__(self, size: int, initializer: Optional[Callable[[], None]] = None) -> None:
+        self._size = max(1, size)
+        self._initializer = initializer
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, fn: Callable, *args) -> Future:
+        fut: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("pool is closed")
+            if len(self._threads) < self._size:
+                t = threading.Thread(target=self._run, daemon=True,
+                                     name=f"com-worker-{len(self._threads)}")
+                self._threads.append(t)
+                t.start()
+        self._queue.put((fut, fn, args))
+        return fut
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._threads:
+                self._queue.put(None)
+
+    def _run(self) -> None:
+        if self._initializer is not None:
+            try:
+                self._initializer()
+            except Exception:
+                pass
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            fut, fn, args = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as e:
+                fut.set_exception(e)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+import json
+import os
+from typing import Dict
+from ports.volume_state_repository import VolumeStateRepository
+
+class JsonVolumeStateAdapter(VolumeStateRepository):
+    def __init__(self, path: str) -> None:
+        self._path = path
+        if not os.path.exists(self._path):
+            self.save_all({})
+
+    def load_all(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def save_all(self, data: Dict[str, Dict[str, object]]) -> None:
+        # Write to a temp file first so a crash mid-write keeps the old state.
+        tmp = self._path + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self._path)
+        except Exception:
+            pass
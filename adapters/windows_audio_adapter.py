@@ -1,6 +1,12 @@
 from __future__ import annotations
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+from adapters.com_worker_pool import ComWorkerPool
 from domain.audio_session import AudioSession
+from domain.session_query import ALL, SessionQuery
+from domain.session_table import SessionTable
 from ports.audio_repository import AudioRepository
 
 try:
@@ -19,32 +25,131 @@ try:
 except Exception:
     comtypes = None
 
-class WindowsAudioAdapter(AudioRepository):
+class _SessionRefs:
+    """COM objects behind the rows of a SessionTable, aligned by row index.
+
+    Kept so peak polls read the cached meters instead of enumerating again.
+    """
+    __slots__ = ("sessions", "meters")
+
+    def __init__(self) -> None:
+        self.sessions: list = []
+        self.meters: list = []
+
+    def clear(self) -> None:
+        self.sessions.clear()
+        self.meters.clear()
+
+    def add(self, session, meter) -> None:
+        self.sessions.append(session)
+        self.meters.append(meter)
+
+    def extend(self, other: _SessionRefs) -> None:
+        self.sessions.extend(other.sessions)
+        self.meters.extend(other.meters)
+
+class _DeviceBuffer:
+    """Per-device tables: a worker fills `scratch`, then swaps it with `committed`.
+
+    The refresh thread only merges `committed`, so a device that is slow,
+    timed out or failed still contributes its last complete read.
+    """
+    __slots__ = ("scratch", "committed", "scratch_refs", "committed_refs", "has_data")
+
     def __init__(self) -> None:
-        self._com_init = False
+        self.scratch = SessionTable()
+        self.committed = SessionTable()
+        self.scratch_refs = _SessionRefs()
+        self.committed_refs = _SessionRefs()
+        self.has_data = False
+
+class WindowsAudioAdapter(AudioRepository):
+    def __init__(self,
+                 include_inactive_devices: bool = False,
+                 workers: int = 4,
+                 device_timeout: float = 0.5) -> None:
+        self._com = threading.local()
         self._DEVICE_FALLBACK = "(device)"
+        self._include_inactive = include_inactive_devices
+        self._workers = workers
+        self._device_timeout = device_timeout
+        self._pool: Optional[ComWorkerPool] = None
+        self._closed = False
+        # Guards _pool, _closed and _pending: close() runs on the Tk thread
+        # while a refresh may be submitting work.
+        self._pool_lock = threading.Lock()
+        # device id -> future still running from an earlier refresh
+        self._pending: Dict[str, Future] = {}
+        # (device id, query fields) -> tables read on the worker pool
+        self._buffers: Dict[tuple[str, FrozenSet[str]], _DeviceBuffer] = {}
+        self._buffers_lock = threading.Lock()
+        # device id -> pids seen at its last successful read, carried into
+        # refreshes that cannot read the device
+        self._device_pids: Dict[str, Set[int]] = {}
+        # Serial path: each device is read here first so its pids are known.
+        self._serial_table = SessionTable()
+        self._serial_refs = _SessionRefs()
+        # Rows of the last fill_sessions and their COM objects, for
+        # fill_peaks. Core Audio session objects are free-threaded, so
+        # pointers read on a worker can be used from the refresh thread.
+        self._snapshot = SessionTable()
+        self._refs = _SessionRefs()
+        self._next_refs = _SessionRefs()
+        self._snapshot_lock = threading.Lock()
+        # device id -> seconds the last read took, None while timed out
+        self._device_timings: Dict[str, Optional[float]] = {}
+        self._timings_lock = threading.Lock()
 
     def _ensure_com(self) -> None:
-        if comtypes and not self._com_init:
+        # COM is initialized per thread: the refresh thread and each worker.
+        if comtypes and not getattr(self._com, "init", False):
             try:
                 comtypes.CoInitialize()
-                self._com_init = True
+                self._com.init = True
             except Exception:
                 pass
 
-    def _get_all_devices(self):
+    @property
+    def device_timings(self) -> Dict[str, Optional[float]]:
+        with self._timings_lock:
+            return dict(self._device_timings)
+
+    def close(self) -> None:
+        """Stop the device workers; later refreshes read devices serially."""
+        with self._pool_lock:
+            self._closed = True
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+            self._pending.clear()
+
+    def _device_state(self):
+        return DEVICE_STATE.MASK_ALL if self._include_inactive else DEVICE_STATE.ACTIVE
+
+    def _get_all_devices(self) -> tuple[list, bool]:
+        """Return (devices, complete); complete is False on the speakers fallback."""
         if AudioUtilities is None:
-            return []
+            return [], True
         try:
             return AudioUtilities.GetAllDevices(
                 data_flow=EDataFlow.eRender.value,
-                device_state=DEVICE_STATE.MASK_ALL.value,
-            )
+                device_state=self._device_state().value,
+            ), True
         except Exception:
             try:
-                return [AudioUtilities.GetSpeakers()]
+                return [AudioUtilities.GetSpeakers()], False
             except Exception:
-                return []
+                return [], False
+
+    def _get_device_ids(self) -> Optional[List[str]]:
+        """Enumerate endpoint ids only, without building full device objects."""
+        try:
+            enumerator = AudioUtilities.GetDeviceEnumerator()
+            collection = enumerator.EnumAudioEndpoints(EDataFlow.eRender.value,
+                                                       self._device_state().value)
+            return [collection.Item(i).GetId() for i in range(collection.GetCount())]
+        except Exception:
+            return None
 
     def _get_device_name(self, dev) -> str:
         if dev is None:
@@ -78,20 +183,31 @@ class WindowsAudioAdapter(AudioRepository):
         except Exception:
             return None
 
-    def _get_proc_info(self, session) -> tuple[Optional[int], Optional[str]]:
+    def _get_pid(self, session) -> Optional[int]:
+        try:
+            return session.ProcessId
+        except Exception:
+            return None
+
+    def _get_proc_name(self, session) -> Optional[str]:
         proc = getattr(session, "Process", None)
         if proc is None:
-            return None, None
+            return None
         try:
-            name = proc.name()
-            pid = proc.pid
-            return pid, name
+            return proc.name()
         except Exception:
-            return None, None
+            return None
 
-    def _get_peak(self, session) -> float:
+    def _get_meter(self, session):
+        try:
+            return session._ctl.QueryInterface(IAudioMeterInformation)
+        except Exception:
+            return None
+
+    def _read_peak(self, meter) -> float:
+        if meter is None:
+            return 0.0
         try:
-            meter = session._ctl.QueryInterface(IAudioMeterInformation)
             return float(meter.GetPeakValue())
         except Exception:
             return 0.0
@@ -105,7 +221,7 @@ class WindowsAudioAdapter(AudioRepository):
             return False, 0.0
 
     def _find_session_in_devices(self, pid: int):
-        devices = self._get_all_devices()
+        devices, _complete = self._get_all_devices()
         for dev in devices:
             enum, count = self._get_session_enumerator(dev)
             if enum is None or count <= 0:
@@ -116,6 +232,21 @@ class WindowsAudioAdapter(AudioRepository):
                     return session
         return None
 
+    def _find_sessions(self, pid: int) -> list:
+        """Return every session of pid on every device, in one pass."""
+        if AudioUtilities is None:
+            return []
+        self._ensure_com()
+        found = []
+        devices, _complete = self._get_all_devices()
+        for dev in devices:
+            enum, count = self._get_session_enumerator(dev)
+            for i in range(count):
+                session = self._get_pycaw_session(enum, i)
+                if session is not None and self._get_pid(session) == pid:
+                    found.append(session)
+        return found
+
     def _find_session_in_all(self, pid: int):
         try:
             for s in AudioUtilities.GetAllSessions():
@@ -134,35 +265,222 @@ class WindowsAudioAdapter(AudioRepository):
         except Exception:
             return False
 
-    def list_sessions(self) -> List[AudioSession]:
+    def list_sessions(self, query: Optional[SessionQuery] = None) -> List[AudioSession]:
+        table = SessionTable()
+        self.fill_sessions(table, query)
+        return table.to_sessions()
+
+    def fill_sessions(self, table: SessionTable, query: Optional[SessionQuery] = None) -> None:
+        query = query or ALL
         self._ensure_com()
-        items: List[AudioSession] = []
+        table.clear()
         if AudioUtilities is None:
-            return items
-        devices = self._get_all_devices()
+            return
+        refs = self._next_refs
+        refs.clear()
+        ids = self._get_device_ids() if self._workers > 1 and not self._closed else None
+        if ids is None or not self._read_devices_parallel(ids, query, table, refs):
+            self._read_devices_serial(query, table, refs)
+        with self._snapshot_lock:
+            self._snapshot.clear()
+            self._snapshot.extend(table)
+            self._refs, self._next_refs = refs, self._refs
+
+    def fill_peaks(self, table: SessionTable) -> None:
+        """Refill table with the rows of the last fill_sessions and fresh peaks.
+
+        Only the meters cached by that refresh are read; no device or session
+        is enumerated.
+        """
+        self._ensure_com()
+        table.clear()
+        with self._snapshot_lock:
+            rows, meters = self._snapshot, self._refs.meters
+            for i in range(len(rows)):
+                table.append(rows.pids[i],
+                             table.intern_name(rows.names[rows.name_idx[i]]),
+                             table.intern_device(rows.devices[rows.device_idx[i]]),
+                             self._read_peak(meters[i]), bool(rows.mutes[i]), rows.volumes[i])
+
+    def _read_devices_serial(self, query: SessionQuery, table: SessionTable,
+                             refs: _SessionRefs) -> None:
+        """Read devices one by one on the calling thread."""
+        devices, enumerated = self._get_all_devices()
+        scratch, scratch_refs = self._serial_table, self._serial_refs
+        read: Set[str] = set()
         for dev in devices:
-            device_name = self._get_device_name(dev)
-            enum, count = self._get_session_enumerator(dev)
-            if enum is None or count <= 0:
+            dev_id = getattr(dev, "id", None)
+            scratch.clear()
+            scratch_refs.clear()
+            if not self._read_device(dev, query, scratch, dev_id, scratch_refs):
                 continue
-            for i in range(count):
-                session = self._get_pycaw_session(enum, i)
-                if session is None:
+            table.extend(scratch)
+            refs.extend(scratch_refs)
+            if dev_id is not None:
+                read.add(dev_id)
+                with self._buffers_lock:
+                    self._remember_pids(dev_id, scratch.live_pids)
+        with self._buffers_lock:
+            if enumerated:
+                listed = {getattr(dev, "id", None) for dev in devices}
+                for dev_id in [d for d in self._device_pids if d not in listed]:
+                    del self._device_pids[dev_id]
+            # Devices not read, including all of them on the speakers fallback.
+            for dev_id, pids in self._device_pids.items():
+                if dev_id not in read:
+                    table.live_pids |= pids
+
+    def _remember_pids(self, dev_id: str, pids: Iterable[int]) -> None:
+        """Record the pids of a device's successful read; call with _buffers_lock held."""
+        known = self._device_pids.get(dev_id)
+        if known is None:
+            known = self._device_pids[dev_id] = set()
+        known.clear()
+        known.update(pids)
+
+    def _read_devices_parallel(self, ids: List[str], query: SessionQuery, table: SessionTable,
+                               refs: _SessionRefs) -> bool:
+        """Read devices on the worker pool and merge them in enumeration order.
+
+        Returns False without touching table if the adapter was closed.
+
+        A device still busy from an earlier refresh is skipped rather than
+        waited on, and all devices share one deadline per refresh. A device
+        not read this refresh (skipped, timed out or failed) contributes its
+        last complete read, and the pids of its last successful read stay in
+        live_pids so they are not taken for exited.
+        """
+        futures: List[Optional[Future]] = []
+        with self._pool_lock:
+            if self._closed:
+                return False
+            if self._pool is None:
+                self._pool = ComWorkerPool(self._workers, self._ensure_com)
+            for dev_id in ids:
+                prev = self._pending.get(dev_id)
+                if prev is not None and not prev.done():
+                    futures.append(None)
                     continue
-                pid, name = self._get_proc_info(session)
-                if not pid or not name:
+                fut = self._pool.submit(self._read_device_by_id, dev_id, query)
+                self._pending[dev_id] = fut
+                futures.append(fut)
+        deadline = time.perf_counter() + self._device_timeout
+        for dev_id, fut in zip(ids, futures):
+            fresh = False
+            if fut is not None:
+                try:
+                    fresh = fut.result(timeout=max(0.0, deadline - time.perf_counter()))
+                except Exception:
+                    if not fut.done():
+                        with self._timings_lock:
+                            self._device_timings[dev_id] = None
+            with self._buffers_lock:
+                buf = self._buffers.get((dev_id, query.fields))
+                if buf is not None and buf.has_data:
+                    table.extend(buf.committed)
+                    refs.extend(buf.committed_refs)
+                if not fresh:
+                    table.live_pids.update(self._device_pids.get(dev_id, ()))
+        live = set(ids)
+        with self._pool_lock:
+            for dev_id in list(self._pending):
+                if dev_id not in live or self._pending[dev_id].done():
+                    del self._pending[dev_id]
+        with self._buffers_lock:
+            for key in [k for k in self._buffers if k[0] not in live]:
+                del self._buffers[key]
+            for dev_id in [d for d in self._device_pids if d not in live]:
+                del self._device_pids[dev_id]
+        with self._timings_lock:
+            for dev_id in [d for d in self._device_timings if d not in live]:
+                del self._device_timings[dev_id]
+        return True
+
+    def _read_device_by_id(self, dev_id: str, query: SessionQuery) -> bool:
+        """Worker side: read one device into its scratch table, then publish it."""
+        self._ensure_com()
+        start = time.perf_counter()
+        try:
+            enumerator = AudioUtilities.GetDeviceEnumerator()
+            dev = AudioUtilities.CreateDevice(enumerator.GetDevice(dev_id))
+        except Exception:
+            dev = None
+        key = (dev_id, query.fields)
+        with self._buffers_lock:
+            buf = self._buffers.get(key)
+            if buf is None:
+                buf = self._buffers[key] = _DeviceBuffer()
+        scratch, scratch_refs = buf.scratch, buf.scratch_refs
+        scratch.clear()
+        scratch_refs.clear()
+        ok = dev is not None and self._read_device(dev, query, scratch, refs=scratch_refs)
+        if ok:
+            # A device that failed to open or enumerate keeps its last read.
+            with self._buffers_lock:
+                buf.scratch, buf.committed = buf.committed, scratch
+                buf.scratch_refs, buf.committed_refs = buf.committed_refs, scratch_refs
+                buf.has_data = True
+                self._remember_pids(dev_id, scratch.live_pids)
+        with self._timings_lock:
+            self._device_timings[dev_id] = time.perf_counter() - start
+        return ok
+
+    def _read_device(self, dev, query: SessionQuery, out: SessionTable,
+                     dev_id: Optional[str] = None,
+                     refs: Optional[_SessionRefs] = None) -> bool:
+        """Append one device's sessions to out, evaluating cheap columns first.
+
+        Order: device name, pid, peak meter, process name (psutil), then
+        volume and mute. A session is dropped at the first failing filter.
+        The session and meter of each appended row are added to refs.
+        Returns False, appending nothing, if the sessions could not be
+        enumerated; the caller must then treat the device as unread.
+        """
+        start = time.perf_counter()
+        device_name = self._get_device_name(dev)
+        enum, count = self._get_session_enumerator(dev)
+        if enum is None:
+            if dev_id is not None:
+                with self._timings_lock:
+                    self._device_timings[dev_id] = time.perf_counter() - start
+            return False
+        device_ok = query.matches_device(device_name)
+        want_volume = query.wants("volume") or query.wants("muted")
+        device_idx = -1
+        for i in range(count):
+            session = self._get_pycaw_session(enum, i)
+            if session is None:
+                continue
+            pid = self._get_pid(session)
+            if not pid:
+                continue
+            if not device_ok:
+                out.mark_live(pid)
+                continue
+            meter = self._get_meter(session) if query.needs_peak else None
+            peak = self._read_peak(meter)
+            if not query.matches_peak(peak, pid):
+                out.mark_live(pid)
+                continue
+            name = ""
+            if query.needs_name:
+                name = self._get_proc_name(session)
+                if not name:
+                    out.mark_live(pid)
+                    continue
+                if not query.matches_process(name):
+                    out.mark_live(pid)
                     continue
-                peak = self._get_peak(session)
-                muted, vol = self._get_mute_and_volume(session)
-                items.append(AudioSession(
-                    pid=pid,
-                    process_name=name,
-                    device_name=device_name,
-                    peak=peak,
-                    muted=muted,
-                    volume=vol,
-                ))
-        return items
+            muted, vol = self._get_mute_and_volume(session) if want_volume else (False, 0.0)
+            if device_idx < 0:
+                device_idx = out.intern_device(device_name)
+            out.append(pid, out.intern_name(name), device_idx, peak, muted, vol)
+            if refs is not None:
+                refs.add(session, meter)
+        if dev_id is not None:
+            with self._timings_lock:
+                self._device_timings[dev_id] = time.perf_counter() - start
+        return True
 
     def _get_session(self, pid: int):
         if AudioUtilities is None:
@@ -192,3 +510,19 @@ class WindowsAudioAdapter(AudioRepository):
             s.SimpleAudioVolume.SetMute(not m, None)
         except Exception:
             pass
+
+    def set_level(self, pid: int, volume: float, muted: bool) -> None:
+        # Sessions from the last snapshot are reused; a pid missing from it
+        # costs one pass over the devices.
+        with self._snapshot_lock:
+            rows, sessions = self._snapshot, self._refs.sessions
+            targets = [sessions[i] for i in range(len(rows)) if rows.pids[i] == pid]
+        if not targets:
+            targets = self._find_sessions(pid)
+        volume = min(1.0, max(0.0, volume))
+        for s in targets:
+            try:
+                s.SimpleAudioVolume.SetMasterVolume(volume, None)
+                s.SimpleAudioVolume.SetMute(bool(muted), None)
+            except Exception:
+                continue
@@ -1,35 +1,62 @@
 from __future__ import annotations
 import time
 import threading
-from typing import Callable, List, Optional
+from dataclasses import replace
+from typing import Callable, List, Optional, Set
 from domain.audio_session import AudioSession
+from domain.session_query import ALL, SessionQuery
+from domain.session_table import SessionTable
 from application.volume_controller import VolumeController
 from application.hotkey_manager import HotkeyManager
+from application.volume_memory import VolumeMemory
 
 class AppManager:
     def __init__(self,
                  volume: VolumeController,
                  hotkeys: HotkeyManager,
                  refresh_interval: float,
-                 active_threshold: float) -> None:
+                 active_threshold: float,
+                 memory: Optional[VolumeMemory] = None,
+                 peak_interval: float = 0.0) -> None:
         self._volume = volume
         self._hotkeys = hotkeys
+        self._memory = memory
         self._refresh_interval = refresh_interval
+        self._peak_interval = peak_interval
         self._active_threshold = active_threshold
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._current_pid: Optional[int] = None
         self._current_device: Optional[str] = None
         self._listeners: List[Callable[[List[AudioSession]], None]] = []
+        self._peak_listeners: List[Callable[[List[AudioSession]], None]] = []
         self._only_active = False
+        self._query: SessionQuery = ALL
+        self._table = SessionTable()
+        self._peak_table = SessionTable()
+        self._refresh_lock = threading.Lock()
+        self._live_pids: Set[int] = set()
+        # Set to cut the loop's sleep short, for stop() or a new query.
+        self._wake = threading.Event()
+        self._refresh_due = False
 
     def set_only_active(self, flag: bool) -> None:
+        # Called from the Tk thread: only swap the query and wake the loop,
+        # which does the refresh. Taking _refresh_lock here could deadlock
+        # against a refresh waiting on the Tk thread.
         self._only_active = flag
-        self.request_refresh()
+        self._query = SessionQuery(min_peak=self._active_threshold) if flag else ALL
+        self._refresh_due = True
+        self._wake.set()
 
     def on_sessions_update(self, callback: Callable[[List[AudioSession]], None]) -> None:
+        """Receive a copy of the sessions after every refresh, on the refresh thread."""
         self._listeners.append(callback)
 
+    def on_peaks_update(self, callback: Callable[[List[AudioSession]], None]) -> None:
+        """Receive the last refresh's sessions with fresh peaks every peak_interval."""
+        self._peak_listeners.append(callback)
+
     def start(self) -> None:
         if self._running:
             return
@@ -39,21 +66,73 @@ class AppManager:
 
     def stop(self) -> None:
         self._running = False
+        self._wake.set()
+        self._volume.close()
+        if self._memory is not None:
+            self._memory.flush()
 
     def _loop(self) -> None:
+        # Full refreshes every refresh_interval; cheap peak polls in between.
+        next_full = 0.0
         while self._running:
-            self.request_refresh()
-            time.sleep(self._refresh_interval)
+            now = time.monotonic()
+            if now >= next_full or self._refresh_due:
+                self._refresh_due = False
+                self.request_refresh()
+                next_full = now + self._refresh_interval
+            else:
+                self.request_peaks()
+            wait = max(0.0, next_full - time.monotonic())
+            if self._peak_listeners and self._peak_interval > 0.0:
+                wait = min(wait, self._peak_interval)
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def request_peaks(self) -> None:
+        if not self._peak_listeners:
+            return
+        with self._refresh_lock:
+            rows = self._volume.peaks(self._peak_table).to_sessions()
+        for cb in self._peak_listeners:
+            cb(rows)
 
     def request_refresh(self) -> None:
-        sessions = self._volume.list_sessions()
-        if self._only_active:
-            sessions = [s for s in sessions if s.peak >= self._active_threshold]
-        for s in sessions:
-            self._hotkeys.set_process_name(s.pid, s.process_name)
+        # The lock guards the reused table and pid bookkeeping only. Listeners
+        # get a copy after it is released, since a listener that waits on the
+        # Tk thread must never hold it.
+        with self._refresh_lock:
+            # The "only active" filter is pushed down so dropped sessions skip
+            # the volume/mute and process-name reads.
+            query = self._query
+            if self._memory is not None and query.min_peak > 0.0:
+                # New sessions bypass the filter once so their levels get restored.
+                query = replace(query, seen_pids=frozenset(self._live_pids))
+            started = time.perf_counter()
+            table = self._volume.snapshot(self._table, query)
+            # Unread devices keep their last pids in live_pids, so this is exact.
+            self._release_exited(set(table.live_pids))
+            if self._memory is not None:
+                self._memory.observe(table, started)
+            sessions = table.rows()
+            if query.seen_pids is not None:
+                sessions = [s for s in sessions if s.peak >= query.min_peak]
+            for s in sessions:
+                self._hotkeys.set_process_name(s.pid, s.process_name)
+            sessions = [s.to_session() for s in sessions]
         for cb in self._listeners:
             cb(sessions)
 
+    def _release_exited(self, alive: Set[int]) -> None:
+        """Drop hotkey handlers and name mappings of pids that left the snapshot.
+
+        Bindings come back through ensure_bindings if the pid shows up again.
+        """
+        for pid in self._live_pids - alive:
+            self._hotkeys.remove_pid(pid)
+            if self._current_pid == pid:
+                self._current_pid = None
+        self._live_pids = alive
+
     def select_pid(self, pid: Optional[int]) -> None:
         self._current_pid = pid
 
@@ -1,15 +1,25 @@
 from __future__ import annotations
-from typing import List
+from typing import List, Optional
 from ports.audio_repository import AudioRepository
 from domain.audio_session import AudioSession
+from domain.session_query import SessionQuery
+from domain.session_table import SessionTable
 
 class VolumeController:
     def __init__(self, audio_repo: AudioRepository, volume_step: float) -> None:
         self._audio = audio_repo
         self._step = volume_step
 
-    def list_sessions(self) -> List[AudioSession]:
-        return self._audio.list_sessions()
+    def list_sessions(self, query: Optional[SessionQuery] = None) -> List[AudioSession]:
+        return self._audio.list_sessions(query)
+
+    def snapshot(self, table: SessionTable, query: Optional[SessionQuery] = None) -> SessionTable:
+        self._audio.fill_sessions(table, query)
+        return table
+
+    def peaks(self, table: SessionTable) -> SessionTable:
+        self._audio.fill_peaks(table)
+        return table
 
     def volume_up(self, pid: int) -> None:
         self._audio.adjust_volume(pid, +self._step)
@@ -19,3 +29,9 @@ class VolumeController:
 
     def toggle_mute(self, pid: int) -> None:
         self._audio.toggle_mute(pid)
+
+    def set_level(self, pid: int, volume: float, muted: bool) -> None:
+        self._audio.set_level(pid, volume, muted)
+
+    def close(self) -> None:
+        self._audio.close()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from application.volume_controller import VolumeController
+from domain.session_table import SessionTable
+from ports.volume_state_repository import VolumeStateRepository
+
+VOLUME_EPSILON = 0.005
+# Refreshes a restore is re-applied for before its level counts as the user's.
+RESTORE_RETRIES = 2
+
+# (volume, muted)
+Level = Tuple[float, bool]
+# (pid, device name)
+Session = Tuple[int, str]
+
+def _same(a: Level, b: Level) -> bool:
+    return abs(a[0] - b[0]) <= VOLUME_EPSILON and a[1] == b[1]
+
+class VolumeMemory:
+    """Remembers volume and mute per process name and restores them on new sessions.
+
+    Saved levels are loaded once. A session counts as new the first time its
+    pid shows up as a row. Known pids are tracked in a set pruned to the live
+    pids every refresh. Sessions already running at the first refresh are
+    only recorded, not restored. A restore applies to every session of the
+    pid and is read back per session. A level is recorded when a session's
+    own level changes between refreshes. Writes happen after `debounce` seconds
+    without further changes.
+    """
+
+    def __init__(self,
+                 repo: VolumeStateRepository,
+                 volume: VolumeController,
+                 debounce: float = 2.0) -> None:
+        self._repo = repo
+        self._volume = volume
+        self._debounce = debounce
+        self._levels: Dict[str, Level] = {}
+        for name, entry in repo.load_all().items():
+            try:
+                self._levels[name.lower()] = (float(entry["volume"]), bool(entry["muted"]))
+            except Exception:
+                continue
+        self._known: Set[int] = set()
+        self._primed = False
+        # session -> level seen on the previous refresh
+        self._last: Dict[Session, Level] = {}
+        # session -> (target level, retries left) for restores not yet read back
+        self._restoring: Dict[Session, Tuple[Level, int]] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self.restore_latencies_ms: Deque[float] = deque(maxlen=100)
+
+    def observe(self, table: SessionTable, detected_at: float) -> None:
+        """Restore new sessions, verify pending restores and record level changes.
+
+        detected_at is the perf_counter() time the snapshot was started; the
+        time from there to each applied restore is kept in
+        restore_latencies_ms.
+        """
+        changed = False
+        # pid -> (process name, [(session, level)]) for pids first seen now
+        new: Dict[int, Tuple[str, List[Tuple[Session, Level]]]] = {}
+        reapplied: Set[int] = set()
+        for row in table.rows():
+            name = row.process_name
+            if not name:
+                continue
+            pid = row.pid
+            session = (pid, row.device_name)
+            current = (row.volume, row.muted)
+            last = self._last.get(session)
+            self._last[session] = current
+            if pid not in self._known:
+                entry = new.get(pid)
+                if entry is None:
+                    new[pid] = (name, [(session, current)])
+                else:
+                    entry[1].append((session, current))
+                continue
+            pending = self._restoring.get(session)
+            if pending is not None:
+                target, retries = pending
+                if _same(current, target):
+                    del self._restoring[session]
+                elif retries > 0:
+                    if pid not in reapplied:
+                        self._volume.set_level(pid, target[0], target[1])
+                        reapplied.add(pid)
+                    self._restoring[session] = (target, retries - 1)
+                else:
+                    # Give up; the level seen now is a baseline, not a change.
+                    del self._restoring[session]
+                continue
+            if last is None or _same(last, current):
+                continue
+            with self._lock:
+                self._levels[name.lower()] = current
+                self._dirty = True
+            changed = True
+        for pid, (name, sessions) in new.items():
+            self._known.add(pid)
+            saved = self._levels.get(name.lower())
+            if not self._primed or saved is None:
+                continue
+            differing = [session for session, current in sessions if not _same(current, saved)]
+            if not differing:
+                continue
+            # One call covers every device the pid plays on.
+            self._volume.set_level(pid, saved[0], saved[1])
+            for session in differing:
+                self._restoring[session] = (saved, RESTORE_RETRIES)
+            self.restore_latencies_ms.append((time.perf_counter() - detected_at) * 1000.0)
+        self._primed = True
+        live = table.live_pids
+        self._known &= live
+        for session in [k for k in self._last if k[0] not in live]:
+            del self._last[session]
+        for session in [k for k in self._restoring if k[0] not in live]:
+            del self._restoring[session]
+        if changed:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._debounce, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write the remembered levels now if changed, cancelling any pending write."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = {name: {"volume": round(vol, 4), "muted": muted}
+                    for name, (vol, muted) in self._levels.items()}
+        self._repo.save_all(data)
@@ -0,0 +1,61 @@
+"""Frame-cost benchmark for LevelMeter with a hundred sessions on screen.
+
+Needs a display. Run from the repository root, headless under Xvfb with a
+screen tall enough for every row:
+
+    xvfb-run -a -s "-screen 0 1280x2400x24" python -m bench.bench_level_meter
+"""
+from __future__ import annotations
+import random
+import time
+import tkinter as tk
+from tkinter import ttk
+from ui.level_meter import FRAME_BUDGET_MS, LevelMeter
+
+SESSIONS = 100
+FRAMES = 300
+
+def main() -> None:
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        # Fail rather than pass silently when there is nothing to draw on.
+        raise SystemExit(f"no display: {e}")
+    # Every row visible, so each frame draws all of them.
+    tree = ttk.Treeview(root, columns=("name",), show="headings", height=SESSIONS)
+    tree.pack(side=tk.LEFT, fill=tk.Y)
+    meter = LevelMeter(root, tree)
+    meter.pack(side=tk.LEFT, fill=tk.Y)
+    rnd = random.Random(0)
+    rows = []
+    for i in range(SESSIONS):
+        iid = f"{1000 + i}::Speakers"
+        tree.insert('', tk.END, iid=iid, values=(f"app{i}.exe",))
+        rows.append((iid, f"app{i}.exe ({1000 + i})", rnd.random(), rnd.random(), False))
+    root.update()
+    meter.set_rows(rows)
+    meter.draw()  # first frame creates the items
+    assert len(meter._slots) == SESSIONS, f"only {len(meter._slots)} of {SESSIONS} rows drawn"
+    peaks = {iid: peak for iid, _label, peak, _vol, _muted in rows}
+    times = []
+    for _ in range(FRAMES):
+        peaks = {iid: min(1.0, max(0.0, p + rnd.uniform(-0.1, 0.1))) for iid, p in peaks.items()}
+        meter.set_peaks(peaks)
+        start = time.perf_counter()
+        meter.draw()
+        root.update_idletasks()
+        times.append((time.perf_counter() - start) * 1000.0)
+    unchanged = time.perf_counter()
+    meter.draw()
+    unchanged = (time.perf_counter() - unchanged) * 1000.0
+    root.destroy()
+
+    times.sort()
+    p50, p95 = times[len(times) // 2], times[int(len(times) * 0.95)]
+    print(f"{SESSIONS} sessions: p50 {p50:.2f} ms, p95 {p95:.2f} ms, "
+          f"unchanged frame {unchanged:.3f} ms (budget {FRAME_BUDGET_MS} ms)")
+    assert p95 < FRAME_BUDGET_MS, "meter frame over budget"
+    print("OK")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Read counts of the adapter's device read: every session vs. the only-active view.
+
+Drives WindowsAudioAdapter._read_device over stub sessions and counts the
+process-name (psutil) and volume/mute reads each query makes.
+Run from the repository root:  python -m bench.bench_session_query
+"""
+from __future__ import annotations
+from bench.fakes import CountingAudioAdapter, StubDevice, StubSession
+from domain.session_query import ALL, SessionQuery
+from domain.session_table import SessionTable
+
+SESSIONS = 100
+ACTIVE = 10
+THRESHOLD = 0.02
+
+def main() -> None:
+    device = StubDevice("Speakers", [
+        StubSession(1000 + i, f"app{i}.exe", peak=0.5 if i < ACTIVE else 0.0)
+        for i in range(SESSIONS)
+    ])
+    adapter = CountingAudioAdapter()
+    table = SessionTable()
+    only_active = SessionQuery(min_peak=THRESHOLD)
+    known = frozenset(s.pid for s in device.sessions)
+    cases = (
+        ("all sessions", ALL, SESSIONS),
+        ("only active", only_active, ACTIVE),
+        # What AppManager sends with volume memory on once every pid is known.
+        ("only active, all seen", SessionQuery(min_peak=THRESHOLD, seen_pids=known), ACTIVE),
+    )
+    for label, query, expected in cases:
+        adapter.reset_counts()
+        table.clear()
+        adapter._read_device(device, query, table)
+        print(f"{label:>22}: {len(table):3d} rows, {adapter.peak_reads:3d} peak, "
+              f"{adapter.name_reads:3d} name, {adapter.volume_reads:3d} volume reads")
+        assert len(table) == expected
+        assert adapter.name_reads == expected, "name read for a filtered-out session"
+        assert adapter.volume_reads == expected, "volume read for a filtered-out session"
+        assert len(table.live_pids) == SESSIONS, "filtered-out pids missing from live_pids"
+    print("OK")
+
+if __name__ == '__main__':
+    main()
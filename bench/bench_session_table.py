@@ -0,0 +1,71 @@
+"""Allocation benchmark: list of AudioSession vs. reused SessionTable.
+
+Run from the repository root:  python -m bench.bench_session_table
+"""
+from __future__ import annotations
+import tracemalloc
+from bench.fakes import FakeAudioRepository
+from domain.session_table import SessionTable
+
+SESSIONS = 64
+TICKS = 200
+
+def _populate() -> FakeAudioRepository:
+    repo = FakeAudioRepository()
+    for i in range(SESSIONS):
+        repo.spawn(1000 + i, f"app{i % 16}.exe", f"Device {i % 4}", peak=0.1, volume=0.5)
+    return repo
+
+def _measure(tick) -> tuple[int, int, int]:
+    """Return (blocks retained, bytes retained, peak bytes) for one steady-state refresh."""
+    for _ in range(TICKS):
+        tick()  # warm-up so steady-state allocations are what gets measured
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tick()
+    current, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    return blocks, current - base, peak - base
+
+def main() -> None:
+    repo = _populate()
+    kept = []
+
+    def list_tick() -> None:
+        kept.clear()
+        kept.append(repo.list_sessions())
+
+    table = SessionTable()
+
+    def table_tick() -> None:
+        kept.clear()
+        repo.fill_sessions(table)
+        kept.append(table.rows())
+
+    # Mirrors the adapter's parallel path: one table per device, merged in order.
+    devices: dict = {}
+    for (pid, device), s in repo.sessions.items():
+        devices.setdefault(device, {})[pid] = s
+    device_tables = [SessionTable() for _ in devices]
+    merged = SessionTable()
+
+    def merge_tick() -> None:
+        kept.clear()
+        merged.clear()
+        for dev_table, sessions in zip(device_tables, devices.values()):
+            dev_table.clear()
+            for pid, s in sessions.items():
+                dev_table.append_session(pid, repo._fresh(s[0]), repo._fresh(s[1]), s[2], s[3], s[4])
+            merged.extend(dev_table)
+        kept.append(merged.rows())
+
+    for label, tick in (("list_sessions", list_tick), ("SessionTable", table_tick),
+                        ("per-device", merge_tick)):
+        blocks, retained, peak = _measure(tick)
+        print(f"{label:>14}: {blocks:5d} blocks / {retained / 1024:7.1f} KiB retained, "
+              f"{peak / 1024:7.1f} KiB peak per refresh")
+    print(f"{'':>14}  ({SESSIONS} sessions, {len(table.names)} interned names)")
+
+if __name__ == '__main__':
+    main()
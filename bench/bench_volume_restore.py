@@ -0,0 +1,98 @@
+"""Restore latency and write debouncing of VolumeMemory against the fake ports.
+
+Run from the repository root:  python -m bench.bench_volume_restore
+"""
+from __future__ import annotations
+import statistics
+import time
+from application.app_manager import AppManager
+from application.hotkey_manager import HotkeyManager
+from application.volume_controller import VolumeController
+from application.volume_memory import VolumeMemory
+from bench.fakes import (FakeAudioRepository, FakeConfigRepository,
+                         FakeHotkeyService, FakeVolumeStateRepository)
+
+APPS = 50
+SPAWNS = 500
+DEBOUNCE = 0.2
+HOTKEY_PRESSES = 40
+
+def main() -> None:
+    audio = FakeAudioRepository()
+    state = FakeVolumeStateRepository({
+        f"app{i}.exe": {"volume": 0.25, "muted": i % 5 == 0} for i in range(APPS)
+    })
+    volume = VolumeController(audio, 0.05)
+    memory = VolumeMemory(state, volume, DEBOUNCE)
+    manager = AppManager(volume, HotkeyManager(FakeHotkeyService(), FakeConfigRepository()),
+                         1.0, 0.02, memory)
+    manager.set_only_active(True)
+    manager.request_refresh()  # startup snapshot: nothing running yet
+
+    # New sessions start at full volume and silent, as Windows would create them.
+    for n in range(SPAWNS):
+        pid = 20_000 + n
+        audio.spawn(pid, f"app{n % APPS}.exe", peak=0.0, volume=1.0)
+        manager.request_refresh()
+        restored = audio.session(pid)
+        assert abs(restored[4] - 0.25) < 1e-9, "volume not restored within one refresh"
+        assert restored[3] == ((n % APPS) % 5 == 0), "mute not restored within one refresh"
+        audio.exit(pid)
+        manager.request_refresh()
+    latencies = sorted(memory.restore_latencies_ms)
+    print(f"restore latency over last {len(latencies)} spawns: "
+          f"median {statistics.median(latencies):.3f} ms, max {latencies[-1]:.3f} ms")
+
+    # Hammer volume up as a held hotkey would; writes must collapse into one.
+    pid = 30_000
+    audio.spawn(pid, "player.exe", peak=0.5, volume=0.1)
+    manager.request_refresh()
+    writes_before = state.writes
+    for _ in range(HOTKEY_PRESSES):
+        volume.volume_up(pid)
+        manager.request_refresh()
+    during = state.writes - writes_before
+    time.sleep(DEBOUNCE * 2)
+    after = state.writes - writes_before
+    print(f"{HOTKEY_PRESSES} hotkey presses: {during} writes while pressing, {after} after settling")
+    assert during == 0 and after == 1, "volume writes not debounced"
+    assert abs(state.data["player.exe"]["volume"] - 1.0) < 1e-9
+
+    # Two sessions of one app at different levels must not flip the saved level.
+    audio.spawn(40_001, "chrome.exe", peak=0.5, volume=0.5)
+    audio.spawn(40_002, "chrome.exe", peak=0.5, volume=0.8)
+    manager.request_refresh()
+    volume.volume_down(40_001)
+    writes_before = state.writes
+    for _ in range(10):
+        manager.request_refresh()
+    time.sleep(DEBOUNCE * 2)
+    print(f"two chrome.exe sessions: {state.writes - writes_before} write(s) after one change")
+    assert state.writes - writes_before == 1, "level flip-flopped between sessions"
+    assert abs(state.data["chrome.exe"]["volume"] - 0.45) < 1e-9
+
+    # A pid playing on two devices gets both sessions restored, with one call.
+    calls = []
+    real_set_level = audio.set_level
+    audio.set_level = lambda pid, vol, muted: (calls.append(pid), real_set_level(pid, vol, muted))
+    audio.spawn(40_004, "app2.exe", "Speakers", peak=0.5, volume=1.0)
+    audio.spawn(40_004, "app2.exe", "Headphones", peak=0.5, volume=0.9)
+    for _ in range(3):
+        manager.request_refresh()
+    print(f"two-device pid: {len(calls)} set_level call(s)")
+    assert calls == [40_004], "restore not applied once per pid"
+    for device in ("Speakers", "Headphones"):
+        assert abs(audio.session(40_004, device)[4] - 0.25) < 1e-9, f"{device} session not restored"
+
+    # A restore that does not take must not overwrite the remembered level.
+    audio.set_level = lambda pid, vol, muted: None
+    audio.spawn(40_003, "app1.exe", peak=0.5, volume=1.0)
+    for _ in range(5):
+        manager.request_refresh()
+    audio.set_level = real_set_level
+    memory.flush()
+    assert abs(state.data["app1.exe"]["volume"] - 0.25) < 1e-9, "failed restore recorded as a change"
+    print("OK")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""In-memory port implementations used by the benchmark and soak scripts."""
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Tuple
+from adapters.windows_audio_adapter import WindowsAudioAdapter
+from domain.audio_session import AudioSession
+from domain.session_query import ALL, SessionQuery
+from domain.session_table import SessionTable
+
+class FakeAudioRepository:
+    def __init__(self) -> None:
+        # (pid, device_name) -> [process_name, device_name, peak, muted, volume]
+        self.sessions: Dict[Tuple[int, str], list] = {}
+        # Rows of the last fill_sessions, re-read by fill_peaks.
+        self._last_rows: List[Tuple[int, str]] = []
+
+    def spawn(self, pid: int, name: str, device: str = "Speakers",
+              peak: float = 0.0, muted: bool = False, volume: float = 1.0) -> None:
+        self.sessions[(pid, device)] = [name, device, peak, muted, volume]
+
+    def exit(self, pid: int) -> None:
+        for key in [k for k in self.sessions if k[0] == pid]:
+            del self.sessions[key]
+
+    def session(self, pid: int, device: str = "Speakers") -> list:
+        return self.sessions[(pid, device)]
+
+    def _of_pid(self, pid: int) -> List[list]:
+        return [s for (p, _device), s in self.sessions.items() if p == pid]
+
+    @staticmethod
+    def _fresh(text: str) -> str:
+        # COM hands back a new string object on every call; mimic that.
+        return text.encode().decode()
+
+    def _matches(self, pid: int, s: list, query: SessionQuery) -> bool:
+        return (query.matches_device(s[1]) and query.matches_peak(s[2], pid)
+                and query.matches_process(s[0]))
+
+    def list_sessions(self, query: Optional[SessionQuery] = None) -> List[AudioSession]:
+        query = query or ALL
+        return [AudioSession(pid=pid, process_name=self._fresh(s[0]), device_name=self._fresh(s[1]),
+                             peak=s[2], muted=s[3], volume=s[4])
+                for (pid, _device), s in self.sessions.items() if self._matches(pid, s, query)]
+
+    def fill_sessions(self, table: SessionTable, query: Optional[SessionQuery] = None) -> None:
+        query = query or ALL
+        table.clear()
+        self._last_rows.clear()
+        for key, s in self.sessions.items():
+            pid = key[0]
+            if self._matches(pid, s, query):
+                table.append_session(pid, self._fresh(s[0]), self._fresh(s[1]), s[2], s[3], s[4])
+                self._last_rows.append(key)
+            else:
+                table.mark_live(pid)
+
+    def fill_peaks(self, table: SessionTable) -> None:
+        table.clear()
+        for key in self._last_rows:
+            s = self.sessions.get(key)
+            if s is not None:
+                table.append_session(key[0], s[0], s[1], s[2], s[3], s[4])
+
+    # Like the adapter, hotkey actions change the first session of the pid.
+    def adjust_volume(self, pid: int, delta: float) -> None:
+        for s in self._of_pid(pid)[:1]:
+            s[4] = min(1.0, max(0.0, s[4] + delta))
+
+    def toggle_mute(self, pid: int) -> None:
+        for s in self._of_pid(pid)[:1]:
+            s[3] = not s[3]
+
+    def set_level(self, pid: int, volume: float, muted: bool) -> None:
+        for s in self._of_pid(pid):
+            s[4] = min(1.0, max(0.0, volume))
+            s[3] = muted
+
+    def close(self) -> None:
+        pass
+
+class StubSession:
+    __slots__ = ("pid", "name", "peak", "muted", "volume")
+
+    def __init__(self, pid: int, name: str, peak: float = 0.0,
+                 muted: bool = False, volume: float = 1.0) -> None:
+        self.pid = pid
+        self.name = name
+        self.peak = peak
+        self.muted = muted
+        self.volume = volume
+
+class StubDevice:
+    def __init__(self, name: str, sessions: List[StubSession]) -> None:
+        self.name = name
+        self.sessions = sessions
+
+class CountingAudioAdapter(WindowsAudioAdapter):
+    """WindowsAudioAdapter whose COM and psutil reads hit stub objects and are counted.
+
+    Drive it through _read_device(StubDevice, query, table) to see which
+    columns a query actually reads.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(workers=1)
+        self.peak_reads = 0
+        self.name_reads = 0
+        self.volume_reads = 0
+
+    def reset_counts(self) -> None:
+        self.peak_reads = self.name_reads = self.volume_reads = 0
+
+    def _get_device_name(self, dev) -> str:
+        return dev.name
+
+    def _get_session_enumerator(self, dev):
+        return dev, len(dev.sessions)
+
+    def _get_pycaw_session(self, enum, index):
+        return enum.sessions[index]
+
+    def _get_pid(self, session) -> Optional[int]:
+        return session.pid
+
+    def _get_meter(self, session):
+        return session
+
+    def _read_peak(self, meter) -> float:
+        if meter is None:
+            return 0.0
+        self.peak_reads += 1
+        return meter.peak
+
+    def _get_proc_name(self, session) -> Optional[str]:
+        self.name_reads += 1
+        return session.name
+
+    def _get_mute_and_volume(self, session) -> tuple[bool, float]:
+        self.volume_reads += 1
+        return session.muted, session.volume
+
+class FakeHotkeyService:
+    def __init__(self) -> None:
+        self.handlers: Dict[int, tuple[str, Callable[[], None]]] = {}
+        self._next_id = 0
+
+    def register(self, hotkey: str, callback: Callable[[], None]) -> int:
+        self._next_id += 1
+        self.handlers[self._next_id] = (hotkey, callback)
+        return self._next_id
+
+    def remove(self, handler_id: int) -> None:
+        self.handlers.pop(handler_id, None)
+
+    def clear_all(self) -> None:
+        self.handlers.clear()
+
+class FakeConfigRepository:
+    def __init__(self, data: Optional[Dict[str, Dict[str, str]]] = None) -> None:
+        self.data: Dict[str, Dict[str, str]] = data or {}
+
+    def load_all(self) -> Dict[str, Dict[str, str]]:
+        return self.data
+
+    def save_hotkey(self, process_name: str, action: str, hotkey: Optional[str]) -> None:
+        entry = self.data.setdefault(process_name.lower(), {})
+        if hotkey:
+            entry[action] = hotkey
+        else:
+            entry.pop(action, None)
+        if not entry:
+            self.data.pop(process_name.lower(), None)
+
+    def clear_all(self) -> None:
+        self.data.clear()
+
+class FakeVolumeStateRepository:
+    def __init__(self, data: Optional[Dict[str, Dict[str, object]]] = None) -> None:
+        self.data: Dict[str, Dict[str, object]] = data or {}
+        self.writes = 0
+
+    def load_all(self) -> Dict[str, Dict[str, object]]:
+        return {k: dict(v) for k, v in self.data.items()}
+
+    def save_all(self, data: Dict[str, Dict[str, object]]) -> None:
+        self.writes += 1
+        self.data = {k: dict(v) for k, v in data.items()}
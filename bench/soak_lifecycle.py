@@ -0,0 +1,69 @@
+"""Soak harness: thousands of process start/exit cycles against the fake ports.
+
+Asserts that memory, registered hotkey handlers, pid mappings and thread
+count stay flat. Run from the repository root:  python -m bench.soak_lifecycle
+"""
+from __future__ import annotations
+import threading
+import tracemalloc
+from application.app_manager import AppManager
+from application.hotkey_manager import HotkeyManager
+from application.volume_controller import VolumeController
+from bench.fakes import FakeAudioRepository, FakeConfigRepository, FakeHotkeyService
+
+CYCLES = 5000
+WARMUP = 500
+CONCURRENT = 8
+BOUND_APPS = ("chrome.exe", "spotify.exe", "discord.exe")
+MEMORY_SLACK = 64 * 1024
+
+def _build():
+    audio = FakeAudioRepository()
+    svc = FakeHotkeyService()
+    cfg = FakeConfigRepository({
+        name: {"up": f"ctrl+{i}", "down": f"alt+{i}", "mute": f"shift+{i}"}
+        for i, name in enumerate(BOUND_APPS)
+    })
+    hotkeys = HotkeyManager(svc, cfg)
+    manager = AppManager(VolumeController(audio, 0.05), hotkeys, 1.0, 0.02)
+    # Mirror what the UI does on every update.
+    manager.on_sessions_update(
+        lambda rows: [manager.ensure_bindings(r.pid, r.process_name) for r in rows])
+    return audio, svc, hotkeys, manager
+
+def _cycle(audio: FakeAudioRepository, manager: AppManager, n: int) -> None:
+    pid = 10_000 + n
+    # Every other process gets a unique name to exercise name interning.
+    name = BOUND_APPS[n % len(BOUND_APPS)] if n % 2 else f"helper{n}.exe"
+    audio.spawn(pid, name, f"Device {n % 3}", peak=0.5)
+    manager.request_refresh()
+    audio.exit(pid - CONCURRENT)
+    manager.request_refresh()
+
+def _measure(svc: FakeHotkeyService, hotkeys: HotkeyManager) -> tuple[int, int, int, int]:
+    return (tracemalloc.get_traced_memory()[0], len(svc.handlers),
+            len(hotkeys._pid_to_name), threading.active_count())
+
+def main() -> None:
+    audio, svc, hotkeys, manager = _build()
+    tracemalloc.start()
+    for n in range(WARMUP):
+        _cycle(audio, manager, n)
+    mem0, handlers0, names0, threads0 = _measure(svc, hotkeys)
+    for n in range(WARMUP, WARMUP + CYCLES):
+        _cycle(audio, manager, n)
+    mem1, handlers1, names1, threads1 = _measure(svc, hotkeys)
+    tracemalloc.stop()
+
+    print(f"cycles={CYCLES} memory {mem0 / 1024:.1f} -> {mem1 / 1024:.1f} KiB, "
+          f"handlers {handlers0} -> {handlers1}, pid names {names0} -> {names1}, "
+          f"threads {threads0} -> {threads1}")
+    assert handlers1 == hotkeys.handler_count, "service and manager disagree on handlers"
+    assert handlers1 <= handlers0, "hotkey handlers leaked"
+    assert names1 <= names0, "pid -> name mappings leaked"
+    assert threads1 <= threads0, "threads leaked"
+    assert mem1 - mem0 < MEMORY_SLACK, "memory grew during soak"
+    print("OK")
+
+if __name__ == '__main__':
+    main()
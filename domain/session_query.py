@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import FrozenSet, Optional
+
+# pid and device_name are always filled; these are the optional columns.
+FIELDS = ("process_name", "peak", "muted", "volume")
+
+@dataclass(slots=True, frozen=True)
+class SessionQuery:
+    fields: FrozenSet[str] = frozenset(FIELDS)
+    min_peak: float = 0.0
+    process_name: Optional[str] = None
+    device_name: Optional[str] = None
+    # Pids the caller already knows. When set, any other pid is returned in
+    # full even if it fails min_peak, so new sessions are seen immediately.
+    seen_pids: Optional[FrozenSet[int]] = None
+
+    def __post_init__(self) -> None:
+        unknown = set(self.fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Invalid fields: {sorted(unknown)}")
+
+    def wants(self, field: str) -> bool:
+        return field in self.fields
+
+    @property
+    def needs_peak(self) -> bool:
+        return self.min_peak > 0.0 or "peak" in self.fields
+
+    @property
+    def needs_name(self) -> bool:
+        return self.process_name is not None or "process_name" in self.fields
+
+    def is_new(self, pid: int) -> bool:
+        return self.seen_pids is not None and pid not in self.seen_pids
+
+    def matches_peak(self, peak: float, pid: int = 0) -> bool:
+        return peak >= self.min_peak or self.is_new(pid)
+
+    def matches_process(self, name: str) -> bool:
+        return self.process_name is None or name.lower() == self.process_name.lower()
+
+    def matches_device(self, name: str) -> bool:
+        return self.device_name is None or name == self.device_name
+
+ALL = SessionQuery()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterator, List, Set
+from domain.audio_session import AudioSession
+
+# Interned names are dropped once the tables outgrow this, so a long run of
+# short-lived, uniquely named processes cannot grow them without bound.
+INTERN_LIMIT = 256
+
+class SessionRow:
+    """Read-only view over one row of a SessionTable.
+
+    Exposes the same attributes as AudioSession so existing consumers keep
+    working. Views are positional and reused across ticks: they reflect the
+    table's current contents, not a frozen copy.
+    """
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: SessionTable, index: int) -> None:
+        self._table = table
+        self._index = index
+
+    @property
+    def pid(self) -> int:
+        return self._table.pids[self._index]
+
+    @property
+    def process_name(self) -> str:
+        return self._table.names[self._table.name_idx[self._index]]
+
+    @property
+    def device_name(self) -> str:
+        return self._table.devices[self._table.device_idx[self._index]]
+
+    @property
+    def peak(self) -> float:
+        return self._table.peaks[self._index]
+
+    @property
+    def muted(self) -> bool:
+        return bool(self._table.mutes[self._index])
+
+    @property
+    def volume(self) -> float:
+        return self._table.volumes[self._index]
+
+    @property
+    def active(self) -> bool:
+        return self.peak > 0.0
+
+    def to_session(self) -> AudioSession:
+        return AudioSession(
+            pid=self.pid,
+            process_name=self.process_name,
+            device_name=self.device_name,
+            peak=self.peak,
+            muted=self.muted,
+            volume=self.volume,
+        )
+
+class SessionTable:
+    """Columnar snapshot of audio sessions, refilled in place every refresh.
+
+    Numeric fields live in parallel arrays; process and device names are
+    interned into lookup tables so a tick that sees the same sessions as the
+    previous one allocates no new strings or row objects.
+    """
+
+    def __init__(self) -> None:
+        self.pids = array('q')
+        self.name_idx = array('i')
+        self.device_idx = array('i')
+        self.peaks = array('d')
+        self.volumes = array('d')
+        self.mutes = array('b')
+        self.names: List[str] = []
+        self.devices: List[str] = []
+        self._name_lookup: Dict[str, int] = {}
+        self._device_lookup: Dict[str, int] = {}
+        self._rows: List[SessionRow] = []
+        self._len = 0
+        # Every pid enumerated this tick, including rows a query filtered out
+        # and pids of devices that could not be read this tick.
+        self.live_pids: Set[int] = set()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def clear(self) -> None:
+        """Start a new snapshot; column storage is kept for reuse."""
+        self._len = 0
+        self.live_pids.clear()
+        if len(self.names) > INTERN_LIMIT:
+            self.names.clear()
+            self._name_lookup.clear()
+        if len(self.devices) > INTERN_LIMIT:
+            self.devices.clear()
+            self._device_lookup.clear()
+
+    def _intern(self, value: str, lookup: Dict[str, int], table: List[str]) -> int:
+        idx = lookup.get(value)
+        if idx is None:
+            idx = len(table)
+            table.append(value)
+            lookup[value] = idx
+        return idx
+
+    def intern_device(self, device_name: str) -> int:
+        return self._intern(device_name, self._device_lookup, self.devices)
+
+    def intern_name(self, process_name: str) -> int:
+        return self._intern(process_name, self._name_lookup, self.names)
+
+    def append(self, pid: int, name_index: int, device_index: int,
+               peak: float, muted: bool, volume: float) -> None:
+        i = self._len
+        if i < len(self.pids):
+            self.pids[i] = pid
+            self.name_idx[i] = name_index
+            self.device_idx[i] = device_index
+            self.peaks[i] = peak
+            self.mutes[i] = 1 if muted else 0
+            self.volumes[i] = volume
+        else:
+            self.pids.append(pid)
+            self.name_idx.append(name_index)
+            self.device_idx.append(device_index)
+            self.peaks.append(peak)
+            self.mutes.append(1 if muted else 0)
+            self.volumes.append(volume)
+            self._rows.append(SessionRow(self, i))
+        self._len = i + 1
+        self.live_pids.add(pid)
+
+    def mark_live(self, pid: int) -> None:
+        """Record a pid that exists but was filtered out of the rows."""
+        self.live_pids.add(pid)
+
+    def append_session(self, pid: int, process_name: str, device_name: str,
+                       peak: float, muted: bool, volume: float) -> None:
+        self.append(pid, self.intern_name(process_name), self.intern_device(device_name),
+                    peak, muted, volume)
+
+    def extend(self, other: SessionTable) -> None:
+        """Append all rows and live pids of other, re-interning its names."""
+        names, devices = other.names, other.devices
+        for i in range(len(other)):
+            self.append(other.pids[i],
+                        self.intern_name(names[other.name_idx[i]]),
+                        self.intern_device(devices[other.device_idx[i]]),
+                        other.peaks[i], other.mutes[i], other.volumes[i])
+        self.live_pids |= other.live_pids
+
+    def rows(self) -> List[SessionRow]:
+        """Return row views for the current snapshot (shares the cached views)."""
+        return self._rows[:self._len]
+
+    def __iter__(self) -> Iterator[SessionRow]:
+        return iter(self.rows())
+
+    def to_sessions(self) -> List[AudioSession]:
+        return [row.to_session() for row in self.rows()]
@@ -11,7 +11,6 @@ _DEFAULT_KEYS = {
     "col.pid": {"en": "PID", "es": "PID"},
     "col.process": {"en": "Process", "es": "Proceso"},
     "col.device": {"en": "Device", "es": "Dispositivo"},
-    "col.peak": {"en": "Peak", "es": "Peak"},
     "col.muted": {"en": "Mute", "es": "Mute"},
     "col.volume": {"en": "Vol", "es": "Vol"},
     "label.selection.none": {"en": "Select a program from the list", "es": "Selecciona un programa de la lista"},
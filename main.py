@@ -5,15 +5,19 @@ import sys
 from adapters.windows_audio_adapter import WindowsAudioAdapter
 from adapters.keyboard_lib_adapter import KeyboardLibAdapter
 from adapters.json_config_adapter import JsonConfigAdapter
+from adapters.json_volume_state_adapter import JsonVolumeStateAdapter
 from application.volume_controller import VolumeController
 from application.hotkey_manager import HotkeyManager
 from application.app_manager import AppManager
+from application.volume_memory import VolumeMemory
 from i18n.translator import Translator
 from ui.app_ui import AppUI
 
 VOLUME_STEP = 0.05
 REFRESH_INTERVAL = 1.0
+PEAK_INTERVAL = 1.0 / 20
 ACTIVE_PEAK_THRESHOLD = 0.02
+VOLUME_SAVE_DEBOUNCE = 2.0
 
 def build_app(language: Optional[str] = None) -> AppUI:
     if sys.platform != 'win32':
@@ -22,9 +26,13 @@ def build_app(language: Optional[str] = None) -> AppUI:
     hotkey_service = KeyboardLibAdapter()
     config_path = os.path.join(os.path.dirname(__file__), 'hotkeys.json')
     config_repo = JsonConfigAdapter(config_path)
+    volumes_path = os.path.join(os.path.dirname(__file__), 'volumes.json')
+    volume_state_repo = JsonVolumeStateAdapter(volumes_path)
     volume_ctrl = VolumeController(audio_repo, VOLUME_STEP)
     hotkey_manager = HotkeyManager(hotkey_service, config_repo)
-    app_manager = AppManager(volume_ctrl, hotkey_manager, REFRESH_INTERVAL, ACTIVE_PEAK_THRESHOLD)
+    volume_memory = VolumeMemory(volume_state_repo, volume_ctrl, VOLUME_SAVE_DEBOUNCE)
+    app_manager = AppManager(volume_ctrl, hotkey_manager, REFRESH_INTERVAL, ACTIVE_PEAK_THRESHOLD,
+                             volume_memory, PEAK_INTERVAL)
     translator = Translator(language)
     ui = AppUI(app_manager, translator)
     return ui
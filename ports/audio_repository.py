@@ -1,10 +1,30 @@
 from __future__ import annotations
-from typing import Protocol, List
+from typing import Protocol, List, Optional
 from domain.audio_session import AudioSession
+from domain.session_query import SessionQuery
+from domain.session_table import SessionTable
 
 class AudioRepository(Protocol):
-    def list_sessions(self) -> List[AudioSession]:
-        """Return all audio sessions across output devices."""
+    def list_sessions(self, query: Optional[SessionQuery] = None) -> List[AudioSession]:
+        """Return audio sessions across output devices matching query (all if None)."""
+        ...
+
+    def fill_sessions(self, table: SessionTable, query: Optional[SessionQuery] = None) -> None:
+        """Refill table in place with sessions matching query (all if None).
+
+        Columns not in query.fields are left at zero/empty. Pids of filtered-out
+        sessions, and of devices that could not be read this time, are still
+        recorded in table.live_pids.
+        """
+        ...
+
+    def fill_peaks(self, table: SessionTable) -> None:
+        """Refill table with the rows of the last fill_sessions and fresh peaks.
+
+        Meant for frequent level polls: sessions are not enumerated again, so
+        sessions that appeared since then are missing until the next
+        fill_sessions.
+        """
         ...
 
     def adjust_volume(self, pid: int, delta: float) -> None:
@@ -14,3 +34,11 @@ class AudioRepository(Protocol):
     def toggle_mute(self, pid: int) -> None:
         """Toggle mute state for session by pid."""
         ...
+
+    def set_level(self, pid: int, volume: float, muted: bool) -> None:
+        """Set absolute volume (0.0-1.0) and mute state of every session of pid."""
+        ...
+
+    def close(self) -> None:
+        """Release background resources; called on shutdown."""
+        ...
@@ -0,0 +1,10 @@
+from __future__ import annotations
+from typing import Protocol, Dict
+
+class VolumeStateRepository(Protocol):
+    def load_all(self) -> Dict[str, Dict[str, object]]:
+        """Return mapping process_name -> {"volume": float, "muted": bool}."""
+        ...
+
+    def save_all(self, data: Dict[str, Dict[str, object]]) -> None:
+        ...
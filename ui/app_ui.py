@@ -5,6 +5,7 @@ from typing import Optional, Tuple, List
 from application.app_manager import AppManager
 from domain.audio_session import AudioSession
 from i18n.translator import Translator
+from ui.level_meter import LevelMeter
 
 HK_NONE_KEY = "hotkey.none"
 HK_ASSIGN_KEY = "hotkey.assign"
@@ -15,15 +16,18 @@ class AppUI(tk.Tk):
         self._m = manager
         self._t = translator
         self.title(self._t.t("app.title"))
-        self.geometry("820x520")
+        self.geometry("1100x560")
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._current_selection_pid: Optional[int] = None
         self._current_selection_key: Optional[Tuple[int, str]] = None
         self._pid_to_name: dict[int, str] = {}
+        self._row_values: dict[str, tuple] = {}
 
         self.only_active_var = tk.BooleanVar(value=False)
         self._build_ui()
-        self._m.on_sessions_update(self._update_sessions)
+        # Updates arrive on the refresh thread; hand them to the Tk thread.
+        self._m.on_sessions_update(lambda rows: self.after(0, self._update_sessions, rows))
+        self._m.on_peaks_update(lambda rows: self.after(0, self._update_peaks, rows))
         self._m.start()
 
     def _build_ui(self) -> None:
@@ -36,25 +40,27 @@ class AppUI(tk.Tk):
                                command=self._toggle_only_active)
         chk.pack(side=tk.LEFT)
 
-        cols = ("pid", "name", "device", "peak", "muted", "volume")
+        cols = ("pid", "name", "device", "muted", "volume")
         self.tree = ttk.Treeview(top, columns=cols, show="headings", height=12)
         self.tree.heading("pid", text=self._t.t("col.pid"))
         self.tree.heading("name", text=self._t.t("col.process"))
         self.tree.heading("device", text=self._t.t("col.device"))
-        self.tree.heading("peak", text=self._t.t("col.peak"))
         self.tree.heading("muted", text=self._t.t("col.muted"))
         self.tree.heading("volume", text=self._t.t("col.volume"))
 
         self.tree.column("pid", width=80, anchor=tk.CENTER)
-        self.tree.column("name", width=300)
-        self.tree.column("device", width=180)
-        self.tree.column("peak", width=80, anchor=tk.CENTER)
+        self.tree.column("name", width=220)
+        self.tree.column("device", width=160)
         self.tree.column("muted", width=80, anchor=tk.CENTER)
         self.tree.column("volume", width=80, anchor=tk.CENTER)
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        # The meter sits beside the tree and draws on the tree's visible rows.
+        self.meter = LevelMeter(top, self.tree)
+        self.meter.pack(side=tk.LEFT, fill=tk.Y)
         scroll = ttk.Scrollbar(top, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.configure(yscrollcommand=lambda first, last: self._on_tree_scroll(scroll, first, last))
+        self.tree.bind("<Configure>", lambda _e: self.meter.invalidate())
         scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
         bottom = ttk.LabelFrame(self, text=self._t.t("label.selection.none"))
@@ -83,32 +89,51 @@ class AppUI(tk.Tk):
         note = ttk.Label(self, text=self._t.t("hint.admin"), foreground="#666")
         note.pack(anchor="w", padx=12, pady=(0, 10))
 
+    def _on_tree_scroll(self, scroll: ttk.Scrollbar, first: str, last: str) -> None:
+        scroll.set(first, last)
+        self.meter.invalidate()
+
     def _toggle_only_active(self) -> None:
         self._m.set_only_active(self.only_active_var.get())
 
     def _update_sessions(self, sessions: List[AudioSession]) -> None:
         prev_key = self._current_selection_key
+        rows = self._row_values
         seen = set()
+        levels = []
         for s in sessions:
             iid = f"{s.pid}::{s.device_name}"
             seen.add(iid)
-            vals = [s.pid, s.process_name, s.device_name, f"{s.peak:.2f}", ("Sí" if s.muted else "No"), f"{int(s.volume*100):d}%"]
-            if iid in self.tree.get_children():
-                self.tree.item(iid, values=vals)
-            else:
-                self.tree.insert('', tk.END, iid=iid, values=vals)
+            # Peak changes every tick; it is drawn by the meter, not the tree.
+            raw = (s.pid, s.process_name, s.device_name, s.muted, s.volume)
+            levels.append((iid, f"{s.process_name} ({s.pid})", s.peak, s.volume, s.muted))
+            old = rows.get(iid)
+            if old is None:
+                self.tree.insert('', tk.END, iid=iid, values=self._format_row(raw))
+            elif old != raw:
+                self.tree.item(iid, values=self._format_row(raw))
+            rows[iid] = raw
             self._m.ensure_bindings(s.pid, s.process_name)
-        for iid in self.tree.get_children():
-            if iid not in seen:
-                self.tree.delete(iid)
+        for iid in [iid for iid in rows if iid not in seen]:
+            del rows[iid]
+            self.tree.delete(iid)
+        self.meter.set_rows(levels)
         if prev_key:
             pid, device = prev_key
             iid = f"{pid}::{device}"
-            if iid in self.tree.get_children():
+            if iid in rows:
                 self.tree.selection_set(iid)
             else:
                 self._clear_selection_labels()
 
+    def _update_peaks(self, rows: List[AudioSession]) -> None:
+        self.meter.set_peaks({f"{r.pid}::{r.device_name}": r.peak for r in rows})
+
+    @staticmethod
+    def _format_row(raw: tuple) -> list:
+        pid, name, device, muted, volume = raw
+        return [pid, name, device, ("Sí" if muted else "No"), f"{int(volume*100):d}%"]
+
     def _clear_selection_labels(self) -> None:
         self._current_selection_pid = None
         self._current_selection_key = None
@@ -0,0 +1,195 @@
+from __future__ import annotations
+import math
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional, Sequence, Tuple
+
+LABEL_WIDTH = 130
+BAR_WIDTH = 160
+SLIDER_WIDTH = 100
+GAP = 10
+MAX_FPS = 30
+MIN_FPS = 5
+FRAME_BUDGET_MS = 8.0
+
+# (tree iid, label, peak, volume, muted)
+MeterRow = Tuple[str, str, float, float, bool]
+
+class _Slot:
+    """Canvas items for one row plus the last values drawn into them."""
+    __slots__ = ("label", "bg", "bar", "track", "fill", "thumb", "drawn")
+
+    def __init__(self, label: int, bg: int, bar: int, track: int, fill: int, thumb: int) -> None:
+        self.label = label
+        self.bg = bg
+        self.bar = bar
+        self.track = track
+        self.fill = fill
+        self.thumb = thumb
+        self.drawn: Optional[tuple] = None
+
+class LevelMeter(tk.Canvas):
+    """Single canvas drawing a peak bar and a volume slider beside a Treeview.
+
+    Rows are keyed by tree iid and drawn at the y position of that tree row,
+    and only for the rows currently visible in the tree. set_rows() and
+    set_peaks() may be called from any thread; they store the data and
+    request a frame if it changed. Frames run on the Tk thread at most
+    MAX_FPS times per second and only touch items whose pixels moved. If a
+    frame exceeds FRAME_BUDGET_MS the frame rate backs off towards MIN_FPS.
+    """
+
+    def __init__(self, master, tree: ttk.Treeview, **kw) -> None:
+        kw.setdefault("width", LABEL_WIDTH + BAR_WIDTH + GAP + SLIDER_WIDTH + 8)
+        kw.setdefault("highlightthickness", 0)
+        super().__init__(master, **kw)
+        self._tree = tree
+        self._lock = threading.Lock()
+        # iid -> (label, volume, muted)
+        self._levels: Dict[str, Tuple[str, float, bool]] = {}
+        self._peaks: Dict[str, float] = {}
+        self._slots: List[_Slot] = []
+        self._visible = 0
+        self._interval_ms = 1000 // MAX_FPS
+        self._last_frame_at = 0.0
+        self.last_frame_ms = 0.0
+        self._frame_requested = False
+        self._after_id: Optional[str] = None
+
+    def set_rows(self, rows: Sequence[MeterRow]) -> None:
+        levels = {iid: (label, volume, muted) for iid, label, _peak, volume, muted in rows}
+        peaks = {iid: peak for iid, _label, peak, _volume, _muted in rows}
+        with self._lock:
+            if levels == self._levels and peaks == self._peaks:
+                return
+            self._levels = levels
+            self._peaks = peaks
+        self._request_frame()
+
+    def set_peaks(self, peaks: Dict[str, float]) -> None:
+        with self._lock:
+            if peaks == self._peaks:
+                return
+            self._peaks = peaks
+        self._request_frame()
+
+    def invalidate(self) -> None:
+        """Redraw after the tree scrolled or resized."""
+        self._request_frame()
+
+    def destroy(self) -> None:
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
+
+    def _request_frame(self) -> None:
+        # Only one frame is ever queued, so an idle meter never wakes Tk.
+        with self._lock:
+            if self._frame_requested:
+                return
+            self._frame_requested = True
+            elapsed_ms = (time.perf_counter() - self._last_frame_at) * 1000.0
+            delay = max(0, int(self._interval_ms - elapsed_ms))
+        # Outside the lock: from a worker thread this call waits for the Tk thread.
+        self._after_id = self.after(delay, self._on_frame)
+
+    def _on_frame(self) -> None:
+        self._after_id = None
+        with self._lock:
+            self._frame_requested = False
+        start = time.perf_counter()
+        self.draw()
+        self._last_frame_at = time.perf_counter()
+        self.last_frame_ms = (self._last_frame_at - start) * 1000.0
+        self._adapt_rate()
+
+    def _adapt_rate(self) -> None:
+        fastest, slowest = 1000 // MAX_FPS, 1000 // MIN_FPS
+        if self.last_frame_ms > FRAME_BUDGET_MS:
+            self._interval_ms = min(slowest, self._interval_ms * 2)
+        elif self.last_frame_ms < FRAME_BUDGET_MS / 2:
+            self._interval_ms = max(fastest, self._interval_ms - 1)
+
+    def _visible_items(self) -> List[Tuple[str, int, int]]:
+        """Return (iid, y, height) of the tree rows currently on screen."""
+        children = self._tree.get_children()
+        n = len(children)
+        if not n:
+            return []
+        first, last = self._tree.yview()
+        items = []
+        for iid in children[int(first * n):min(n, math.ceil(last * n) + 1)]:
+            bbox = self._tree.bbox(iid)
+            if bbox:
+                items.append((iid, bbox[1], bbox[3]))
+        return items
+
+    def draw(self) -> None:
+        """Draw the visible tree rows with the latest levels in one pass."""
+        with self._lock:
+            levels, peaks = self._levels, self._peaks
+        rows = []
+        for iid, y, height in self._visible_items():
+            level = levels.get(iid)
+            if level is not None:
+                label, volume, muted = level
+                rows.append((y, height, label, peaks.get(iid, 0.0), volume, muted))
+        self.redraw(rows)
+
+    def _new_slot(self) -> _Slot:
+        x_bar = LABEL_WIDTH
+        x_slider = LABEL_WIDTH + BAR_WIDTH + GAP
+        label = self.create_text(4, 0, anchor="w", text="")
+        bg = self.create_rectangle(x_bar, 0, x_bar + BAR_WIDTH, 0, outline="#999", fill="#eee")
+        bar = self.create_rectangle(x_bar, 0, x_bar, 0, outline="", fill="#3a3")
+        track = self.create_line(x_slider, 0, x_slider + SLIDER_WIDTH, 0, fill="#bbb", width=3)
+        fill = self.create_line(x_slider, 0, x_slider, 0, fill="#36c", width=3)
+        thumb = self.create_rectangle(x_slider - 3, 0, x_slider + 3, 0, outline="#333", fill="#fff")
+        return _Slot(label, bg, bar, track, fill, thumb)
+
+    def _set_slot_state(self, slot: _Slot, state: str) -> None:
+        for item in (slot.label, slot.bg, slot.bar, slot.track, slot.fill, slot.thumb):
+            self.itemconfigure(item, state=state)
+
+    def redraw(self, rows: Sequence[Tuple[int, int, str, float, float, bool]]) -> None:
+        """Apply (y, height, label, peak, volume, muted) rows to the canvas items."""
+        while len(self._slots) < len(rows):
+            self._slots.append(self._new_slot())
+        for i in range(len(rows), self._visible):
+            self._set_slot_state(self._slots[i], "hidden")
+            self._slots[i].drawn = None
+        for i in range(self._visible, len(rows)):
+            self._set_slot_state(self._slots[i], "normal")
+        self._visible = len(rows)
+
+        x_bar = LABEL_WIDTH
+        x_slider = LABEL_WIDTH + BAR_WIDTH + GAP
+        for i, (y, height, label, peak, volume, muted) in enumerate(rows):
+            slot = self._slots[i]
+            peak_px = int(min(1.0, max(0.0, peak)) * BAR_WIDTH)
+            vol_px = int(min(1.0, max(0.0, volume)) * SLIDER_WIDTH)
+            drawn = slot.drawn
+            if drawn == (y, height, label, peak_px, vol_px, muted):
+                continue
+            moved = drawn is None or drawn[0] != y or drawn[1] != height
+            mid = y + height // 2
+            top, bottom = y + 4, y + height - 4
+            if moved:
+                self.coords(slot.label, 4, mid)
+                self.coords(slot.bg, x_bar, top, x_bar + BAR_WIDTH, bottom)
+                self.coords(slot.track, x_slider, mid, x_slider + SLIDER_WIDTH, mid)
+            if drawn is None or drawn[2] != label:
+                self.itemconfigure(slot.label, text=label)
+            if moved or drawn[3] != peak_px:
+                self.coords(slot.bar, x_bar, top, x_bar + peak_px, bottom)
+            if moved or drawn[4] != vol_px:
+                x = x_slider + vol_px
+                self.coords(slot.fill, x_slider, mid, x, mid)
+                self.coords(slot.thumb, x - 3, top - 1, x + 3, bottom + 1)
+            if drawn is None or drawn[5] != muted:
+                self.itemconfigure(slot.fill, fill="#aaa" if muted else "#36c")
+                self.itemconfigure(slot.bar, fill="#aaa" if muted else "#3a3")
+            slot.drawn = (y, height, label, peak_px, vol_px, muted)